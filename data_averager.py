@@ -3,89 +3,231 @@ Data Averaging and Wind Shift Calculation Library
 Handles time-windowed averaging of navigation data and wind shift calculations
 """
 
-from datetime import datetime, timedelta
-from collections import deque
+import time
+
+import numpy as np
+
+# Per-channel ring buffer capacity. Power of two so indices wrap with a
+# bitwise AND instead of a modulo.
+RING_CAPACITY = 4096
+_MASK = RING_CAPACITY - 1
+
+# Averaged data channels, in fixed order for array indexing
+CHANNELS = ('vmg', 'cog', 'sog', 'true_wind_speed', 'true_wind_angle',
+            'apparent_wind_speed', 'apparent_wind_angle',
+            'absolute_wind_direction')
 
 class DataAverager:
     def __init__(self, window_minutes=5):
-        self.window = timedelta(minutes=window_minutes)
-        self.data = {
-            'vmg': deque(),
-            'cog': deque(),
-            'sog': deque(),
-            'true_wind_speed': deque(),
-            'true_wind_angle': deque(),
-            'apparent_wind_speed': deque(),
-            'apparent_wind_angle': deque(),
-            'absolute_wind_direction': deque(),
-            'timestamps': deque()
-        }
-    
+        self.window_seconds = window_minutes * 60.0
+
+        # Map channel names to row indices into the arrays below
+        self.channel_index = {name: i for i, name in enumerate(CHANNELS)}
+
+        # Preallocated ring buffers: one row of values and timestamps per
+        # channel, plus running sums so averages are O(1)
+        n = len(CHANNELS)
+        self.values = np.zeros((n, RING_CAPACITY), dtype=np.float64)
+        self.timestamps = np.zeros((n, RING_CAPACITY), dtype=np.float64)
+        self.sums = np.zeros(n, dtype=np.float64)
+
+        # Monotonically increasing write/read positions per channel;
+        # masked with _MASK when indexing into the rings
+        self.heads = [0] * n
+        self.tails = [0] * n
+        self.counts = [0] * n
+
+        # Memoized query results, keyed on the data revision so repeated
+        # calls within one display tick reuse the previous computation
+        self._dirty = 0
+        self._averages_key = -1
+        self._averages = None
+
+        # Wind shifts are recomputed only when new absolute wind samples
+        # arrive, tracked by their own revision counter
+        self._abs_wind_ch = self.channel_index['absolute_wind_direction']
+        self._abs_wind_rev = 0
+        self._shift_keys = {}
+        self._shifts = {}
+
+        # Reused output array for snapshot()
+        self._snapshot = np.empty(n, dtype=np.float64)
+
+        # While True, add_data defers window cleanup until bulk_end
+        self._bulk = False
+
     def add_data(self, data_type, value, timestamp=None):
         """Add a data point to the averaging window"""
+        ch = self.channel_index.get(data_type)
+        if ch is None:
+            return
+
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        self._append(ch, value, timestamp)
+        if not self._bulk:
+            self._cleanup_old_data()
+
+    def add_data_many(self, items, timestamp=None):
+        """Add several data points sharing one timestamp, with one cleanup pass"""
         if timestamp is None:
-            timestamp = datetime.now()
-        
-        if data_type in self.data:
-            self.data[data_type].append(value)
-            self.data['timestamps'].append(timestamp)
+            timestamp = time.monotonic()
+
+        for data_type, value in items.items():
+            ch = self.channel_index.get(data_type)
+            if ch is not None:
+                self._append(ch, value, timestamp)
+
+        if not self._bulk:
             self._cleanup_old_data()
-    
+
+    def bulk_begin(self):
+        """Defer window cleanup while a batch of samples is ingested"""
+        self._bulk = True
+
+    def bulk_end(self):
+        """Finish a batch ingest with a single cleanup pass"""
+        self._bulk = False
+        self._cleanup_old_data()
+
+    def _append(self, ch, value, timestamp):
+        """Push one sample onto a channel ring without running cleanup"""
+        # If the ring is full, evict the oldest sample before overwriting
+        if self.counts[ch] == RING_CAPACITY:
+            tail = self.tails[ch]
+            self.sums[ch] -= self.values[ch, tail & _MASK]
+            self.tails[ch] = tail + 1
+            self.counts[ch] -= 1
+
+        head = self.heads[ch]
+        self.values[ch, head & _MASK] = value
+        self.timestamps[ch, head & _MASK] = timestamp
+        self.heads[ch] = head + 1
+        self.counts[ch] += 1
+        self.sums[ch] += value
+        self._dirty += 1
+        if ch == self._abs_wind_ch:
+            self._abs_wind_rev += 1
+
     def _cleanup_old_data(self):
         """Remove data points outside the time window"""
-        cutoff = datetime.now() - self.window
-        while self.data['timestamps'] and self.data['timestamps'][0] < cutoff:
-            self.data['timestamps'].popleft()
-            for key in self.data:
-                if key != 'timestamps' and self.data[key]:
-                    self.data[key].popleft()
-    
+        cutoff = time.monotonic() - self.window_seconds
+        for ch in range(len(CHANNELS)):
+            count = self.counts[ch]
+            if not count:
+                continue
+
+            tail = self.tails[ch]
+            start = tail & _MASK
+            end = start + count
+            timestamps = self.timestamps[ch]
+
+            # Timestamps are appended in order, so a binary search finds how
+            # many entries fall before the cutoff in one shot
+            if end <= RING_CAPACITY:
+                n_evict = int(np.searchsorted(timestamps[start:end], cutoff))
+                if n_evict:
+                    self.sums[ch] -= self.values[ch, start:start + n_evict].sum()
+            else:
+                # Ring is wrapped: search the two contiguous halves
+                first = RING_CAPACITY - start
+                n_evict = int(np.searchsorted(timestamps[start:], cutoff))
+                if n_evict == first:
+                    n_evict += int(np.searchsorted(
+                        timestamps[:end - RING_CAPACITY], cutoff))
+                if n_evict:
+                    evicted = self.values[ch, start:start + min(n_evict, first)].sum()
+                    if n_evict > first:
+                        evicted += self.values[ch, :n_evict - first].sum()
+                    self.sums[ch] -= evicted
+
+            if n_evict:
+                self.tails[ch] = tail + n_evict
+                self.counts[ch] = count - n_evict
+
     def get_average(self, data_type):
         """Get the average value for a specific data type"""
-        if data_type in self.data and self.data[data_type]:
-            return sum(self.data[data_type]) / len(self.data[data_type])
+        ch = self.channel_index.get(data_type)
+        if ch is not None and self.counts[ch]:
+            return self.sums[ch] / self.counts[ch]
         return 0
-    
+
+    def snapshot(self):
+        """Get all channel averages as one array, indexed by channel_index
+
+        The returned array is reused between calls; copy it if it needs to
+        survive the next snapshot.
+        """
+        np.divide(self.sums, np.maximum(self.counts, 1), out=self._snapshot)
+        return self._snapshot
+
     def get_all_averages(self):
         """Get averages for all data types"""
-        return {key: self.get_average(key) for key in self.data if key != 'timestamps'}
-    
+        if self._averages_key == self._dirty:
+            return self._averages
+        self._averages = {key: self.get_average(key) for key in CHANNELS}
+        self._averages_key = self._dirty
+        return self._averages
+
     def get_wind_shift(self, minutes):
         """Calculate wind shift over specified time period"""
-        if 'absolute_wind_direction' not in self.data or not self.data['absolute_wind_direction']:
+        if self._shift_keys.get(minutes) == self._abs_wind_rev:
+            return self._shifts[minutes]
+        shift = self._compute_wind_shift(minutes)
+        self._shifts[minutes] = shift
+        self._shift_keys[minutes] = self._abs_wind_rev
+        return shift
+
+    def _compute_wind_shift(self, minutes):
+        """Compute wind shift over specified time period (uncached)"""
+        ch = self.channel_index['absolute_wind_direction']
+        head = self.heads[ch]
+        tail = self.tails[ch]
+        count = head - tail
+
+        if count < 2:
             return 0
-            
-        cutoff = datetime.now() - timedelta(minutes=minutes)
-        
-        # Find values within the time window
-        wind_values = []
-        for i, timestamp in enumerate(self.data['timestamps']):
-            if timestamp >= cutoff and i < len(self.data['absolute_wind_direction']):
-                wind_values.append(self.data['absolute_wind_direction'][i])
-        
-        if len(wind_values) < 2:
+
+        cutoff = time.monotonic() - minutes * 60.0
+        start = tail & _MASK
+        end = start + count
+        timestamps = self.timestamps[ch]
+
+        # Binary search for the oldest sample within the time window
+        if end <= RING_CAPACITY:
+            idx = tail + int(np.searchsorted(timestamps[start:end], cutoff))
+        else:
+            first = RING_CAPACITY - start
+            n = int(np.searchsorted(timestamps[start:], cutoff))
+            if n == first:
+                n += int(np.searchsorted(timestamps[:end - RING_CAPACITY], cutoff))
+            idx = tail + n
+
+        if head - idx < 2:
             return 0
-        
-        # Calculate the difference between current and oldest value in the window
-        # Handle circular nature of wind direction (0-360 degrees)
-        current_wind = wind_values[-1]
-        old_wind = wind_values[0]
-        
-        diff = current_wind - old_wind
-        
-        # Normalize to -180 to +180 range
-        if diff > 180:
-            diff -= 360
-        elif diff < -180:
-            diff += 360
-            
-        return diff
-    
+
+        # Difference between current and oldest value in the window,
+        # normalized branchlessly to -180..+180 to handle the circular
+        # nature of wind direction (0-360 degrees)
+        current_wind = self.values[ch, (head - 1) & _MASK]
+        old_wind = self.values[ch, idx & _MASK]
+
+        return (current_wind - old_wind + 180.0) % 360.0 - 180.0
+
     def get_data_count(self):
         """Get the number of data points in the current window"""
-        return len(self.data['timestamps'])
-    
+        return sum(self.counts)
+
     def clear_all_data(self):
         """Clear all stored data"""
-        for key in self.data:
-            self.data[key].clear()
\ No newline at end of file
+        # Resetting the positions and sums is enough: old ring contents
+        # are overwritten on the next push, so zeroing the value and
+        # timestamp arrays would be wasted work
+        n = len(CHANNELS)
+        self.sums.fill(0.0)
+        self.heads = [0] * n
+        self.tails = [0] * n
+        self.counts = [0] * n
+        self._dirty += 1
+        self._abs_wind_rev += 1
@@ -3,7 +3,69 @@ Navigation Data Storage and Management
 Handles current navigation state, waypoint information, and route data
 """
 
+from math import sin, cos, atan2, radians, degrees, floor
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+def _wrap360(x):
+    """Wrap an angle in degrees to 0-360, branch-free"""
+    return x - 360.0 * floor(x * (1.0 / 360.0))
+
+def _bearing_kernel(lat1, lon1, lat2, lon2):
+    """Bearing in degrees between two points (pure-math kernel)"""
+    # Convert to radians
+    lat1_r = radians(lat1)
+    lat2_r = radians(lat2)
+    delta_lon_r = radians(lon2 - lon1)
+
+    # Calculate bearing
+    y = sin(delta_lon_r) * cos(lat2_r)
+    x = (cos(lat1_r) * sin(lat2_r) -
+         sin(lat1_r) * cos(lat2_r) * cos(delta_lon_r))
+
+    return _wrap360(degrees(atan2(y, x)))  # Normalize to 0-360
+
+# JIT-compile the kernels when Numba is available; the pure-Python kernel
+# and the NumPy leg-bearing path are the fallback
+_leg_bearings_kernel = None
+if njit is not None:
+    _wrap360 = njit(cache=True, fastmath=True)(_wrap360)
+    _bearing_kernel = njit(cache=True, fastmath=True)(_bearing_kernel)
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _leg_bearings_kernel(lats_r, lons_r, out):
+        for i in prange(out.shape[0]):
+            lat1 = lats_r[i]
+            lat2 = lats_r[i + 1]
+            delta_lon = lons_r[i + 1] - lons_r[i]
+            y = sin(delta_lon) * cos(lat2)
+            x = cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(delta_lon)
+            out[i] = _wrap360(degrees(atan2(y, x)))
+
 class NavigationData:
+    # Fixed attribute layout: slot access skips the per-instance __dict__
+    # on the per-message update path and shrinks each instance
+    __slots__ = (
+        'current_cog', 'current_sog', 'current_vmg',
+        'true_wind_speed', 'true_wind_angle',
+        'apparent_wind_speed', 'apparent_wind_angle',
+        'absolute_wind_direction',
+        'latitude', 'longitude',
+        'current_waypoint', 'current_waypoint_id',
+        'bearing_to_waypoint', 'distance_to_waypoint',
+        'next_waypoint', 'next_waypoint_id', 'course_to_next',
+        'destination_latitude', 'destination_longitude', 'cross_track_error',
+        'current_route_id', 'route_waypoints', 'waypoint_sequence',
+        'waypoint_index', 'route_lats', 'route_lons', '_route_view',
+        'wind_shift_1min', 'wind_shift_5min', 'wind_shift_10min',
+    )
+
     def __init__(self):
         # Navigation state
         self.current_cog = 0
@@ -39,6 +101,10 @@ class NavigationData:
         self.current_route_id = 0
         self.route_waypoints = {}  # Dictionary of waypoint_id: {lat, lon, name}
         self.waypoint_sequence = []  # Ordered list of waypoint IDs in route
+        self.waypoint_index = {}  # waypoint_id: position in waypoint_sequence
+        self.route_lats = []  # Waypoint latitudes in route order
+        self.route_lons = []  # Waypoint longitudes in route order
+        self._route_view = MappingProxyType(self.route_waypoints)
         
         # Wind shift data
         self.wind_shift_1min = 0
@@ -68,7 +134,8 @@ class NavigationData:
         
         # Calculate absolute wind direction
         if self.true_wind_angle is not None and self.current_cog is not None:
-            self.absolute_wind_direction = (self.true_wind_angle + self.current_cog) % 360
+            self.absolute_wind_direction = _wrap360(
+                self.true_wind_angle + self.current_cog)
     
     def update_position(self, latitude=None, longitude=None):
         """Update position data"""
@@ -111,9 +178,16 @@ class NavigationData:
             'name': name
         }
         
-        # Update sequence if not already present
-        if waypoint_id not in self.waypoint_sequence:
+        # Update sequence and coordinate columns if not already present
+        index = self.waypoint_index.get(waypoint_id)
+        if index is None:
+            self.waypoint_index[waypoint_id] = len(self.waypoint_sequence)
             self.waypoint_sequence.append(waypoint_id)
+            self.route_lats.append(latitude)
+            self.route_lons.append(longitude)
+        else:
+            self.route_lats[index] = latitude
+            self.route_lons[index] = longitude
     
     def update_route(self, route_id=None, waypoints_list=None):
         """Update route information"""
@@ -124,6 +198,9 @@ class NavigationData:
             # Clear existing route waypoints
             self.route_waypoints.clear()
             self.waypoint_sequence.clear()
+            self.waypoint_index.clear()
+            self.route_lats.clear()
+            self.route_lons.clear()
             
             # Add new waypoints
             for wp in waypoints_list:
@@ -143,14 +220,11 @@ class NavigationData:
     
     def get_next_waypoint_in_route(self):
         """Get the next waypoint in the current route"""
-        try:
-            current_index = self.waypoint_sequence.index(self.current_waypoint_id)
-            if current_index + 1 < len(self.waypoint_sequence):
-                next_wp_id = self.waypoint_sequence[current_index + 1]
-                if next_wp_id in self.route_waypoints:
-                    return self.route_waypoints[next_wp_id]
-        except (ValueError, IndexError):
-            pass
+        current_index = self.waypoint_index.get(self.current_waypoint_id)
+        if current_index is not None and current_index + 1 < len(self.waypoint_sequence):
+            next_wp_id = self.waypoint_sequence[current_index + 1]
+            if next_wp_id in self.route_waypoints:
+                return self.route_waypoints[next_wp_id]
         return None
     
     def calculate_course_to_next_waypoint(self):
@@ -169,25 +243,33 @@ class NavigationData:
                 self.next_waypoint = next_wp['name']
                 self.next_waypoint_id = next_wp.get('waypoint_id', 0)
     
+    def compute_all_leg_bearings(self):
+        """Calculate bearings for every leg of the current route"""
+        if len(self.waypoint_sequence) < 2:
+            return np.empty(0)
+
+        lats = np.radians(self.route_lats)
+        lons = np.radians(self.route_lons)
+
+        if _leg_bearings_kernel is not None:
+            out = np.empty(len(lats) - 1)
+            _leg_bearings_kernel(lats, lons, out)
+            return out
+
+        # One vectorized pass over all legs instead of per-pair trig calls
+        lat1 = lats[:-1]
+        lat2 = lats[1:]
+        delta_lon = lons[1:] - lons[:-1]
+
+        y = np.sin(delta_lon) * np.cos(lat2)
+        x = (np.cos(lat1) * np.sin(lat2) -
+             np.sin(lat1) * np.cos(lat2) * np.cos(delta_lon))
+
+        return (np.degrees(np.arctan2(y, x)) + 360) % 360
+
     def _calculate_bearing(self, lat1, lon1, lat2, lon2):
         """Calculate bearing between two points"""
-        import math
-        
-        # Convert to radians
-        lat1_r = math.radians(lat1)
-        lat2_r = math.radians(lat2)
-        delta_lon_r = math.radians(lon2 - lon1)
-        
-        # Calculate bearing
-        y = math.sin(delta_lon_r) * math.cos(lat2_r)
-        x = (math.cos(lat1_r) * math.sin(lat2_r) - 
-             math.sin(lat1_r) * math.cos(lat2_r) * math.cos(delta_lon_r))
-        
-        bearing = math.atan2(y, x)
-        bearing = math.degrees(bearing)
-        bearing = (bearing + 360) % 360  # Normalize to 0-360
-        
-        return bearing
+        return _bearing_kernel(lat1, lon1, lat2, lon2)
     
     def update_wind_shifts(self, shift_1min=None, shift_5min=None, shift_10min=None):
         """Update wind shift data"""
@@ -224,13 +306,19 @@ class NavigationData:
             'Cross Track Error': self.cross_track_error
         }
     
-    def get_route_summary(self):
-        """Get a summary of route information"""
+    def get_route_summary(self, copy=False):
+        """Get a summary of route information
+
+        Returns read-only views of the route by default; pass copy=True
+        for an isolated snapshot.
+        """
         return {
             'Route ID': self.current_route_id,
             'Total Waypoints': len(self.route_waypoints),
-            'Waypoint Sequence': self.waypoint_sequence.copy(),
-            'Route Waypoints': self.route_waypoints.copy()
+            'Waypoint Sequence': (self.waypoint_sequence.copy() if copy
+                                  else tuple(self.waypoint_sequence)),
+            'Route Waypoints': (self.route_waypoints.copy() if copy
+                                else self._route_view)
         }
     
     def get_wind_shift_summary(self):
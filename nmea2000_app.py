@@ -11,6 +11,7 @@ from kivy.uix.button import Button
 from kivy.uix.textinput import TextInput
 from kivy.uix.gridlayout import GridLayout
 from kivy.clock import Clock
+from kivy.core.window import Window
 from kivy.garden.matplotlib.backend_kivyagg import FigureCanvasKivyAgg
 
 # Import our custom libraries
@@ -33,9 +34,24 @@ class NMEA2000App(App):
         # Initialize TCP client with callbacks
         self.tcp_client = NMEA2000TCPClient(
             message_callback=self.on_message_received,
+            batch_callback=self.on_messages_received,
             status_callback=self.on_status_change
         )
-        
+
+        # Per-message dispatch: one dict lookup on the parsed type instead
+        # of a chain of string comparisons
+        self._msg_handlers = {
+            'navigation': self._handle_navigation,
+            'wind': self._handle_wind,
+            'waypoint_nav': self._handle_waypoint_nav,
+            'waypoint_info': self._handle_waypoint_info,
+            'navigation_route_info': self._handle_route_info,
+            'cross_track_error': self._handle_xte,
+            'route_waypoint_database': self._handle_route_database,
+            'position': self._handle_position,
+        }
+
+
         # Create main layout
         main_layout = BoxLayout(orientation='vertical', padding=10, spacing=10)
         
@@ -77,11 +93,31 @@ class NMEA2000App(App):
         
         main_layout.add_widget(data_layout)
         
-        # Schedule updates
-        Clock.schedule_interval(self.update_display, 1.0)
-        Clock.schedule_interval(self.update_plots, 10.0)
-        
+        # Single 1 Hz tick drives the display and, every 10th tick, the
+        # plots; paused while the window is minimized
+        self._tick_n = 0
+        self._tick_event = Clock.schedule_interval(self._tick, 1.0)
+        Window.bind(on_minimize=self._on_minimize, on_restore=self._on_restore)
+
         return main_layout
+
+    def _tick(self, dt):
+        """Periodic update driving the display and, less often, the plots"""
+        self._tick_n += 1
+        self.update_display(dt)
+        if self._tick_n % 10 == 0:
+            self.update_plots(dt)
+
+    def _on_minimize(self, *args):
+        """Stop periodic updates while the window is hidden"""
+        if self._tick_event is not None:
+            self._tick_event.cancel()
+            self._tick_event = None
+
+    def _on_restore(self, *args):
+        """Resume periodic updates when the window is shown again"""
+        if self._tick_event is None:
+            self._tick_event = Clock.schedule_interval(self._tick, 1.0)
     
     def _create_navigation_panel(self):
         """Create the navigation data display panel"""
@@ -89,14 +125,28 @@ class NMEA2000App(App):
         left_panel.add_widget(Label(text='Current Navigation Data', 
                                   size_hint_y=None, height=30, bold=True))
         
+        # (display name, averager key, format string) built once so
+        # update_display is a single loop with no per-tick unit branching
+        nav_data_items = [
+            ('COG', 'cog', 'COG: {:.1f}°'),
+            ('SOG', 'sog', 'SOG: {:.1f} kts'),
+            ('VMG', 'vmg', 'VMG: {:.1f} kts'),
+            ('True Wind Speed', 'true_wind_speed', 'True Wind Speed: {:.1f} kts'),
+            ('True Wind Angle', 'true_wind_angle', 'True Wind Angle: {:.1f}°'),
+            ('App Wind Speed', 'apparent_wind_speed', 'App Wind Speed: {:.1f} kts'),
+            ('App Wind Angle', 'apparent_wind_angle', 'App Wind Angle: {:.1f}°'),
+            ('Abs Wind Direction', 'absolute_wind_direction',
+             'Abs Wind Direction: {:.1f}°'),
+        ]
+
         self.nav_labels = {}
-        nav_data_items = ['COG', 'SOG', 'VMG', 'True Wind Speed', 'True Wind Angle', 
-                         'App Wind Speed', 'App Wind Angle', 'Abs Wind Direction']
-        
-        for item in nav_data_items:
-            self.nav_labels[item] = Label(text=f'{item}: --', size_hint_y=None, height=30)
-            left_panel.add_widget(self.nav_labels[item])
-        
+        self._nav_spec = []
+        for item, key, fmt in nav_data_items:
+            label = Label(text=f'{item}: --', size_hint_y=None, height=30)
+            self.nav_labels[item] = label
+            self._nav_spec.append((label, self.averager.channel_index[key], fmt))
+            left_panel.add_widget(label)
+
         return left_panel
     
     def _create_waypoint_panel(self):
@@ -107,14 +157,27 @@ class NMEA2000App(App):
         center_panel.add_widget(Label(text='Waypoint Information', 
                                     size_hint_y=None, height=30, bold=True))
         
+        # (display name, NavigationData attribute, format string) built
+        # once; update_display formats straight from the attributes with
+        # no intermediate summary dict
+        waypoint_items = [
+            ('Current WP', 'current_waypoint', 'Current WP: {}'),
+            ('Bearing to WP', 'bearing_to_waypoint', 'Bearing to WP: {:.1f}°'),
+            ('Distance to WP', 'distance_to_waypoint', 'Distance to WP: {:.2f} nm'),
+            ('Dest Latitude', 'destination_latitude', 'Dest Latitude: {:.6f}°'),
+            ('Dest Longitude', 'destination_longitude', 'Dest Longitude: {:.6f}°'),
+            ('Cross Track Error', 'cross_track_error', 'Cross Track Error: {:.1f} m'),
+            ('Next WP', 'next_waypoint', 'Next WP: {}'),
+            ('Course to Next', 'course_to_next', 'Course to Next: {:.1f}°'),
+        ]
+
         self.waypoint_labels = {}
-        waypoint_items = ['Current WP', 'Bearing to WP', 'Distance to WP', 
-                         'Dest Latitude', 'Dest Longitude', 'Cross Track Error',
-                         'Next WP', 'Course to Next']
-        
-        for item in waypoint_items:
-            self.waypoint_labels[item] = Label(text=f'{item}: --', size_hint_y=None, height=25)
-            center_panel.add_widget(self.waypoint_labels[item])
+        self._waypoint_spec = []
+        for item, attr, fmt in waypoint_items:
+            label = Label(text=f'{item}: --', size_hint_y=None, height=25)
+            self.waypoint_labels[item] = label
+            self._waypoint_spec.append((label, attr, fmt))
+            center_panel.add_widget(label)
         
         # Wind shift section
         center_panel.add_widget(Label(text='Wind Shifts', 
@@ -143,8 +206,11 @@ class NMEA2000App(App):
         plot_controls.add_widget(export_btn)
         right_panel.add_widget(plot_controls)
         
-        # Add matplotlib canvas
+        # Add matplotlib canvas; the plotting manager blits line artists
+        # over cached backgrounds between full draws
         self.canvas = FigureCanvasKivyAgg(self.plotting_manager.get_figure())
+        self.canvas.mpl_connect('resize_event',
+                                self.plotting_manager.invalidate_backgrounds)
         right_panel.add_widget(self.canvas)
         
         return right_panel
@@ -182,78 +248,100 @@ class NMEA2000App(App):
         
         # Process different message types
         self._process_parsed_message(parsed)
-    
+
+    def on_messages_received(self, raw_list):
+        """Callback for a batch of messages received together"""
+        process = self._process_parsed_message
+
+        # One averaging-window cleanup per batch instead of per frame
+        self.averager.bulk_begin()
+        try:
+            for parsed in self.parser.parse_batch(raw_list):
+                if parsed:
+                    process(parsed)
+        finally:
+            self.averager.bulk_end()
+
     def _process_parsed_message(self, parsed):
         """Process a parsed NMEA2000 message"""
-        if parsed.get('type') == 'navigation':
-            if 'cog' in parsed:
-                self.nav_data.update_navigation(cog=parsed['cog'])
-                self.averager.add_data('cog', parsed['cog'])
-            if 'sog' in parsed:
-                self.nav_data.update_navigation(sog=parsed['sog'])
-                self.averager.add_data('sog', parsed['sog'])
-                # Calculate VMG (simplified as SOG for this example)
-                self.nav_data.update_navigation(vmg=parsed['sog'])
-                self.averager.add_data('vmg', parsed['sog'])
-        
-        elif parsed.get('type') == 'wind':
-            if parsed.get('reference') == 'true':
-                self.nav_data.update_wind(true_speed=parsed['speed'], 
-                                        true_angle=parsed['angle'])
-                self.averager.add_data('true_wind_speed', parsed['speed'])
-                self.averager.add_data('true_wind_angle', parsed['angle'])
-                
-                # Calculate absolute wind direction
-                absolute_wind_dir = (parsed['angle'] + self.nav_data.current_cog) % 360
-                self.averager.add_data('absolute_wind_direction', absolute_wind_dir)
-                
-            else:
-                self.nav_data.update_wind(apparent_speed=parsed['speed'], 
-                                        apparent_angle=parsed['angle'])
-                self.averager.add_data('apparent_wind_speed', parsed['speed'])
-                self.averager.add_data('apparent_wind_angle', parsed['angle'])
-        
-        elif parsed.get('type') == 'waypoint_nav':
-            self.nav_data.update_waypoint(
-                bearing=parsed.get('bearing_to_waypoint', 0),
-                distance=parsed.get('distance_to_waypoint', 0)
-            )
-        
-        elif parsed.get('type') == 'waypoint_info':
-            self.nav_data.update_waypoint(
-                current_wp=parsed.get('name', 'N/A'),
-                waypoint_id=parsed.get('waypoint_id', 0)
-            )
-        
-        elif parsed.get('type') == 'navigation_route_info':
-            # Update destination waypoint coordinates and navigation info
-            self.nav_data.update_waypoint(
-                waypoint_id=parsed.get('waypoint_id', 0),
-                bearing=parsed.get('bearing_to_waypoint', 0),
-                distance=parsed.get('distance_to_waypoint', 0),
-                dest_lat=parsed.get('destination_latitude', 0),
-                dest_lon=parsed.get('destination_longitude', 0)
-            )
-            
-            # Calculate course to next waypoint
-            self.nav_data.calculate_course_to_next_waypoint()
-        
-        elif parsed.get('type') == 'cross_track_error':
-            self.nav_data.update_waypoint(xte=parsed.get('xte', 0))
-        
-        elif parsed.get('type') == 'route_waypoint_database':
-            # Update route information with waypoint coordinates
-            self.nav_data.update_route(
-                route_id=parsed.get('route_id', 0),
-                waypoints_list=parsed.get('waypoints', [])
-            )
-        
-        elif parsed.get('type') == 'position':
-            self.nav_data.update_position(
-                latitude=parsed.get('latitude', 0),
-                longitude=parsed.get('longitude', 0)
-            )
-    
+        handler = self._msg_handlers.get(parsed.type)
+        if handler:
+            handler(parsed)
+
+    def _handle_navigation(self, parsed):
+        """Handle COG/SOG navigation messages"""
+        # VMG is simplified as SOG for this example
+        sog = parsed.sog
+        self.nav_data.update_navigation(cog=parsed.cog, sog=sog, vmg=sog)
+        self.averager.add_data_many({'cog': parsed.cog, 'sog': sog,
+                                     'vmg': sog})
+
+    def _handle_wind(self, parsed):
+        """Handle true/apparent wind messages"""
+        if parsed.reference == 'true':
+            self.nav_data.update_wind(true_speed=parsed.speed,
+                                      true_angle=parsed.angle)
+            self.averager.add_data('true_wind_speed', parsed.speed)
+            self.averager.add_data('true_wind_angle', parsed.angle)
+
+            # Calculate absolute wind direction
+            absolute_wind_dir = (parsed.angle + self.nav_data.current_cog) % 360
+            self.averager.add_data('absolute_wind_direction', absolute_wind_dir)
+
+        else:
+            self.nav_data.update_wind(apparent_speed=parsed.speed,
+                                      apparent_angle=parsed.angle)
+            self.averager.add_data('apparent_wind_speed', parsed.speed)
+            self.averager.add_data('apparent_wind_angle', parsed.angle)
+
+    def _handle_waypoint_nav(self, parsed):
+        """Handle waypoint navigation messages"""
+        self.nav_data.update_waypoint(
+            bearing=parsed.bearing_to_waypoint,
+            distance=parsed.distance_to_waypoint
+        )
+
+    def _handle_waypoint_info(self, parsed):
+        """Handle waypoint information messages"""
+        self.nav_data.update_waypoint(
+            current_wp=parsed.name,
+            waypoint_id=parsed.waypoint_id
+        )
+
+    def _handle_route_info(self, parsed):
+        """Handle navigation route info messages"""
+        # Update destination waypoint coordinates and navigation info;
+        # destination_longitude is None when the message omits it
+        self.nav_data.update_waypoint(
+            waypoint_id=parsed.waypoint_id,
+            bearing=parsed.bearing_to_waypoint,
+            distance=parsed.distance_to_waypoint,
+            dest_lat=parsed.destination_latitude,
+            dest_lon=parsed.destination_longitude
+        )
+
+        # Calculate course to next waypoint
+        self.nav_data.calculate_course_to_next_waypoint()
+
+    def _handle_xte(self, parsed):
+        """Handle cross track error messages"""
+        self.nav_data.update_waypoint(xte=parsed.xte)
+
+    def _handle_route_database(self, parsed):
+        """Handle route/waypoint database messages"""
+        # Update route information with waypoint coordinates
+        self.nav_data.update_route(
+            route_id=parsed.route_id,
+            waypoints_list=parsed.waypoints
+        )
+
+    def _handle_position(self, parsed):
+        """Handle position messages"""
+        self.nav_data.update_position(
+            latitude=parsed.latitude,
+            longitude=parsed.longitude
+        )
+
     def on_status_change(self, status):
         """Callback for status changes"""
         self.status_label.text = f'Status: {status}'
@@ -263,60 +351,34 @@ class NMEA2000App(App):
         # Update message counter
         self.log_label.text = f'Messages: {self.tcp_client.get_message_count()}'
         
-        # Get averaged data
-        averages = self.averager.get_all_averages()
-        
-        # Update navigation data display
-        nav_summary = {
-            'COG': averages.get('cog', 0),
-            'SOG': averages.get('sog', 0),
-            'VMG': averages.get('vmg', 0),
-            'True Wind Speed': averages.get('true_wind_speed', 0),
-            'True Wind Angle': averages.get('true_wind_angle', 0),
-            'App Wind Speed': averages.get('apparent_wind_speed', 0),
-            'App Wind Angle': averages.get('apparent_wind_angle', 0),
-            'Abs Wind Direction': averages.get('absolute_wind_direction', 0)
-        }
-        
-        for key, value in nav_summary.items():
-            if key in ['COG', 'True Wind Angle', 'App Wind Angle', 'Abs Wind Direction']:
-                self.nav_labels[key].text = f"{key}: {value:.1f}°"
-            else:
-                self.nav_labels[key].text = f"{key}: {value:.1f} kts"
-        
-        # Update waypoint information
-        waypoint_summary = self.nav_data.get_waypoint_summary()
-        
-        self.waypoint_labels['Current WP'].text = f"Current WP: {waypoint_summary['Current WP']}"
-        self.waypoint_labels['Bearing to WP'].text = f"Bearing to WP: {waypoint_summary['Bearing to WP']:.1f}°"
-        self.waypoint_labels['Distance to WP'].text = f"Distance to WP: {waypoint_summary['Distance to WP']:.2f} nm"
-        self.waypoint_labels['Dest Latitude'].text = f"Dest Latitude: {waypoint_summary['Dest Latitude']:.6f}°"
-        self.waypoint_labels['Dest Longitude'].text = f"Dest Longitude: {waypoint_summary['Dest Longitude']:.6f}°"
-        self.waypoint_labels['Cross Track Error'].text = f"Cross Track Error: {waypoint_summary['Cross Track Error']:.1f} m"
-        self.waypoint_labels['Next WP'].text = f"Next WP: {waypoint_summary['Next WP']}"
-        self.waypoint_labels['Course to Next'].text = f"Course to Next: {waypoint_summary['Course to Next']:.1f}°"
+        # Update navigation data display from one packed averages snapshot
+        snapshot = self.averager.snapshot()
+        for label, channel, fmt in self._nav_spec:
+            label.text = fmt.format(snapshot[channel])
         
+        # Update waypoint information straight from the navigation state
+        nav_data = self.nav_data
+        for label, attr, fmt in self._waypoint_spec:
+            label.text = fmt.format(getattr(nav_data, attr))
+
         # Update wind shift information
-        wind_shift_1min = self.averager.get_wind_shift(1)
-        wind_shift_5min = self.averager.get_wind_shift(5)
-        wind_shift_10min = self.averager.get_wind_shift(10)
-        
-        self.wind_shift_labels['1 min'].text = f"1 min: {wind_shift_1min:+.1f}°"
-        self.wind_shift_labels['5 min'].text = f"5 min: {wind_shift_5min:+.1f}°"
-        self.wind_shift_labels['10 min'].text = f"10 min: {wind_shift_10min:+.1f}°"
+        for period, minutes in (('1 min', 1), ('5 min', 5), ('10 min', 10)):
+            shift = self.averager.get_wind_shift(minutes)
+            self.wind_shift_labels[period].text = f"{period}: {shift:+.1f}°"
     
     def update_plots(self, dt):
         """Update the plots with current averaged data"""
         averages = self.averager.get_all_averages()
         self.plotting_manager.add_data_point(averages)
-        self.plotting_manager.update_plots()
-        self.canvas.draw()
-    
+        limits_changed = self.plotting_manager.update_plots()
+        if limits_changed is not None:
+            self.plotting_manager.draw(self.canvas, full=limits_changed)
+
     def clear_plots(self, instance):
         """Clear all plot data"""
         self.plotting_manager.clear_data()
         self.plotting_manager.update_plots()
-        self.canvas.draw()
+        self.plotting_manager.draw(self.canvas, full=True)
     
     def export_plots(self, instance):
         """Export current plots to file"""
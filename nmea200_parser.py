@@ -3,85 +3,223 @@ NMEA2000 Message Parser Library
 Handles parsing of various NMEA2000 PGN messages
 """
 
-import struct
 import math
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import nmea_jit
+except ImportError:
+    nmea_jit = None
+
+# Integer fields are read with int.from_bytes on O(1) memoryview slices,
+# which skips the struct format interpreter entirely on CPython 3.11+
+_from_bytes = int.from_bytes
+
+# Folded field-scale constants
+_ANGLE_SCALE = 0.0001 * 180.0 / math.pi  # 0.0001 rad units to degrees
+_LATLON_SCALE = 1e-7
+_CENTI = 0.01
+
+# Lookup tables: one indexed load replaces per-call bit masking. Wind
+# reference strings by 3-bit reference code, and (xte_mode,
+# nav_terminated) pairs pre-decoded for every possible flag byte
+_WIND_REF = ('true', 'true', 'apparent', 'true',
+             'true', 'true', 'true', 'true')
+_XTE_FLAGS = tuple(((b & 0x0F), (b & 0x40) != 0) for b in range(256))
+
+def _message_type(name, type_name, fields, defaults=()):
+    """Build a slotted message class with a fixed type attribute"""
+    base = namedtuple(name, fields, defaults=defaults)
+    return type(name, (base,), {'__slots__': (), 'type': type_name})
+
+# Parsed messages: one fixed-layout tuple subclass per message type
+# instead of a freshly keyed dict per frame. The type tag lives on the
+# class, so constructing a message is a single tuple allocation
+PositionMsg = _message_type(
+    'PositionMsg', 'position', ('latitude', 'longitude'))
+NavigationMsg = _message_type(
+    'NavigationMsg', 'navigation', ('cog', 'sog'))
+WindMsg = _message_type(
+    'WindMsg', 'wind', ('speed', 'angle', 'reference'))
+WaypointNavMsg = _message_type(
+    'WaypointNavMsg', 'waypoint_nav',
+    ('bearing_to_waypoint', 'distance_to_waypoint'))
+WaypointInfoMsg = _message_type(
+    'WaypointInfoMsg', 'waypoint_info', ('waypoint_id', 'name'))
+CrossTrackErrorMsg = _message_type(
+    'CrossTrackErrorMsg', 'cross_track_error',
+    ('xte', 'xte_mode', 'nav_terminated'))
+NavigationRouteInfoMsg = _message_type(
+    'NavigationRouteInfoMsg', 'navigation_route_info',
+    ('route_id', 'waypoint_id', 'distance_to_waypoint',
+     'bearing_to_waypoint', 'destination_latitude',
+     'destination_longitude'), defaults=(None,))
+WaypointListMsg = _message_type(
+    'WaypointListMsg', 'waypoint_list', ('raw_data', 'length'))
+RouteWaypointDatabaseMsg = _message_type(
+    'RouteWaypointDatabaseMsg', 'route_waypoint_database',
+    ('database_id', 'route_id', 'nav_direction', 'supplementary_route',
+     'waypoints'))
+UnknownMsg = _message_type('UnknownMsg', 'unknown', ('pgn', 'raw'))
+ErrorMsg = _message_type('ErrorMsg', 'error', ('error',))
+
+# Field layouts for the fixed-layout numeric PGNs: message class,
+# minimum payload length, then (reader, offset, scale) per message
+# field, in constructor order. Parsers for these are generated below as
+# straight-line functions with every offset and scale folded into the
+# source
+_SCHEMA = {
+    129025: (PositionMsg, 8,
+             ((4, True, 0, '_LATLON_SCALE'),      # latitude
+              (4, True, 4, '_LATLON_SCALE'))),    # longitude
+    129026: (NavigationMsg, 8,
+             ((2, False, 2, '_ANGLE_SCALE'),      # cog
+              (2, False, 4, '_CENTI'))),          # sog
+    129284: (WaypointNavMsg, 8,
+             ((2, False, 4, '_ANGLE_SCALE'),      # bearing_to_waypoint
+              (4, False, 0, '_CENTI'))),          # distance_to_waypoint
+}
+
+def _generate_parser(pgn):
+    """exec a specialized parser function for one _SCHEMA entry"""
+    msg_class, min_len, fields = _SCHEMA[pgn]
+    args = ', '.join(
+        f"_from_bytes(data[{offset}:{offset + width}], 'little'"
+        f"{', signed=True' if signed else ''}) * {scale}"
+        for width, signed, offset, scale in fields)
+    source = (
+        f"def parse_pgn_{pgn}(data):\n"
+        f"    \"\"\"Parse PGN {pgn} - generated from _SCHEMA\"\"\"\n"
+        f"    if len(data) < {min_len}:\n"
+        f"        return None\n"
+        f"    return {msg_class.__name__}({args})\n")
+    namespace = {'_from_bytes': _from_bytes,
+                 '_ANGLE_SCALE': _ANGLE_SCALE,
+                 '_LATLON_SCALE': _LATLON_SCALE, '_CENTI': _CENTI,
+                 msg_class.__name__: msg_class}
+    exec(source, namespace)
+    return namespace[f'parse_pgn_{pgn}']
+
+_GENERATED = {pgn: _generate_parser(pgn) for pgn in _SCHEMA}
+
+# Waypoint record layout in PGN 130074's database list: 16-byte records
+# decoded in one frombuffer call instead of a per-waypoint struct loop
+_WP_RECORD = np.dtype([('id', '<u2'), ('lat', '<i4'), ('lon', '<i4'),
+                       ('pad', 'V6')])
+
+# Route messages repeat the same waypoints constantly, so decoded names
+# and the WP<id> fallback labels are memoized
+@lru_cache(maxsize=1024)
+def _decode_wp_name(name_bytes, wid):
+    """Decode a null-stripped waypoint name, falling back to WP<id>"""
+    try:
+        return name_bytes.decode('ascii', errors='ignore')
+    except:
+        return _wp_label(wid)
+
+@lru_cache(maxsize=1024)
+def _wp_label(wid):
+    """Default WP<id> label for unnamed waypoints"""
+    return f"WP{wid}"
 
 class NMEA2000Parser:
     def __init__(self):
-        self.pgn_parsers = {
-            129025: self.parse_position_rapid_update,
-            129026: self.parse_cog_sog_rapid_update,
+        # Fixed-layout numeric PGNs use the generated parsers; the
+        # variable-layout and flag-carrying ones stay hand-written
+        self.pgn_parsers = dict(_GENERATED)
+        self.pgn_parsers.update({
             130306: self.parse_wind_data,
-            129284: self.parse_navigation_data,
             129285: self.parse_route_waypoint_info,
             129283: self.parse_cross_track_error,
             129281: self.parse_navigation_route_info,
             129540: self.parse_waypoint_list,
             130074: self.parse_route_waypoint_database
-        }
-    
+        })
+        # Bound .get so dispatch is one hash lookup per message
+        self._dispatch = self.pgn_parsers.get
+
     def parse_message(self, raw_data):
         """Parse raw NMEA2000 message"""
         try:
             if len(raw_data) < 8:
                 return None
-            
+
             # Extract CAN ID and PGN
-            can_id = struct.unpack('>I', raw_data[:4])[0]
+            mv = memoryview(raw_data)
+            can_id = _from_bytes(mv[0:4], 'big')
             pgn = (can_id >> 8) & 0x1FFFF
-            
-            data = raw_data[8:]  # Skip header
-            
-            if pgn in self.pgn_parsers:
-                return self.pgn_parsers[pgn](data)
-            
-            return {'pgn': pgn, 'raw': raw_data.hex()}
+
+            data = mv[8:]  # Skip header, O(1) on the memoryview
+
+            parser = self._dispatch(pgn)
+            if parser is not None:
+                return parser(data)
+
+            return UnknownMsg(pgn, mv.hex())
         except Exception as e:
-            return {'error': str(e)}
-    
-    def parse_position_rapid_update(self, data):
-        """Parse PGN 129025 - Position Rapid Update"""
-        if len(data) < 8:
-            return None
-        lat = struct.unpack('<i', data[0:4])[0] * 1e-7
-        lon = struct.unpack('<i', data[4:8])[0] * 1e-7
-        return {'type': 'position', 'latitude': lat, 'longitude': lon}
-    
-    def parse_cog_sog_rapid_update(self, data):
-        """Parse PGN 129026 - COG & SOG Rapid Update"""
-        if len(data) < 8:
-            return None
-        cog = struct.unpack('<H', data[2:4])[0] * 0.0001 * 180 / math.pi
-        sog = struct.unpack('<H', data[4:6])[0] * 0.01
-        return {'type': 'navigation', 'cog': cog, 'sog': sog}
+            return ErrorMsg(str(e))
+
+    def parse_batch(self, raw_list):
+        """Parse a batch of raw messages in one pass
+
+        Fixed-layout PGNs are decoded by the Numba batch kernel when
+        available; everything else falls back to parse_message. Results
+        line up with raw_list and unparseable frames yield None.
+        """
+        if nmea_jit is None or not nmea_jit.JIT_ENABLED:
+            return [self.parse_message(raw) for raw in raw_list]
+
+        # Pack the frames into one uint8 matrix for the kernel
+        n = len(raw_list)
+        max_len = 8
+        for raw in raw_list:
+            if len(raw) > max_len:
+                max_len = len(raw)
+        frames = np.zeros((n, max_len), dtype=np.uint8)
+        lengths = np.empty(n, dtype=np.int64)
+        for i, raw in enumerate(raw_list):
+            lengths[i] = len(raw)
+            frames[i, :len(raw)] = np.frombuffer(raw, dtype=np.uint8)
+
+        codes = np.empty(n, dtype=np.int64)
+        fields = np.zeros((n, 4), dtype=np.float64)
+        nmea_jit.parse_batch(frames, lengths, codes, fields)
+
+        # Dict construction stays on the consumer side, once per frame
+        results = []
+        for i in range(n):
+            code = codes[i]
+            if code == nmea_jit.CODE_POSITION:
+                results.append(PositionMsg(float(fields[i, 0]),
+                                           float(fields[i, 1])))
+            elif code == nmea_jit.CODE_NAVIGATION:
+                results.append(NavigationMsg(float(fields[i, 0]),
+                                             float(fields[i, 1])))
+            elif code == nmea_jit.CODE_WIND:
+                results.append(WindMsg(float(fields[i, 0]),
+                                       float(fields[i, 1]),
+                                       _WIND_REF[int(fields[i, 2])]))
+            elif code == nmea_jit.CODE_WAYPOINT_NAV:
+                results.append(WaypointNavMsg(float(fields[i, 0]),
+                                              float(fields[i, 1])))
+            elif code == nmea_jit.CODE_XTE:
+                results.append(CrossTrackErrorMsg(float(fields[i, 0]),
+                                                  int(fields[i, 1]),
+                                                  bool(fields[i, 2])))
+            else:
+                results.append(self.parse_message(raw_list[i]))
+        return results
     
     def parse_wind_data(self, data):
         """Parse PGN 130306 - Wind Data"""
         if len(data) < 6:
             return None
-        wind_speed = struct.unpack('<H', data[0:2])[0] * 0.01
-        wind_angle = struct.unpack('<H', data[2:4])[0] * 0.0001 * 180 / math.pi
-        reference = data[4] & 0x07
-        
-        wind_type = 'apparent' if reference == 2 else 'true'
-        return {
-            'type': 'wind',
-            'speed': wind_speed,
-            'angle': wind_angle,
-            'reference': wind_type
-        }
-    
-    def parse_navigation_data(self, data):
-        """Parse PGN 129284 - Navigation Data"""
-        if len(data) < 8:
-            return None
-        bearing_to_waypoint = struct.unpack('<H', data[4:6])[0] * 0.0001 * 180 / math.pi
-        distance_to_waypoint = struct.unpack('<I', data[0:4])[0] * 0.01
-        return {
-            'type': 'waypoint_nav',
-            'bearing_to_waypoint': bearing_to_waypoint,
-            'distance_to_waypoint': distance_to_waypoint
-        }
+        wind_speed = _from_bytes(data[0:2], 'little') * _CENTI
+        wind_angle = _from_bytes(data[2:4], 'little') * _ANGLE_SCALE
+        return WindMsg(wind_speed, wind_angle, _WIND_REF[data[4] & 0x07])
     
     def parse_route_waypoint_info(self, data):
         """Parse PGN 129285 - Route/Waypoint Information"""
@@ -89,29 +227,23 @@ class NMEA2000Parser:
             return None
         
         # Extract basic waypoint info
-        waypoint_id = struct.unpack('<H', data[0:2])[0]
-        waypoint_name = ""
-        
+        waypoint_id = _from_bytes(data[0:2], 'little')
+
         # Try to extract waypoint name if available
         if len(data) > 8:
-            # Name typically starts at byte 8, null-terminated
-            name_data = data[8:]
+            # Name typically starts at byte 8, null-terminated; bytes()
+            # because memoryview frames have no find()
+            name_data = bytes(data[8:])
             null_pos = name_data.find(b'\x00')
             if null_pos > 0:
-                try:
-                    waypoint_name = name_data[:null_pos].decode('ascii', errors='ignore')
-                except:
-                    waypoint_name = f"WP{waypoint_id}"
+                waypoint_name = _decode_wp_name(bytes(name_data[:null_pos]),
+                                                waypoint_id)
             else:
-                waypoint_name = f"WP{waypoint_id}"
+                waypoint_name = _wp_label(waypoint_id)
         else:
-            waypoint_name = f"WP{waypoint_id}"
+            waypoint_name = _wp_label(waypoint_id)
         
-        return {
-            'type': 'waypoint_info',
-            'waypoint_id': waypoint_id,
-            'name': waypoint_name
-        }
+        return WaypointInfoMsg(waypoint_id, waypoint_name)
     
     def parse_cross_track_error(self, data):
         """Parse PGN 129283 - Cross Track Error"""
@@ -119,18 +251,12 @@ class NMEA2000Parser:
             return None
         
         # XTE mode and navigation terminated flags
-        xte_mode = data[0] & 0x0F
-        nav_terminated = (data[0] & 0x40) != 0
+        xte_mode, nav_terminated = _XTE_FLAGS[data[0]]
         
         # Cross track error in meters
-        xte = struct.unpack('<i', data[1:5])[0] * 0.01
+        xte = _from_bytes(data[1:5], 'little', signed=True) * _CENTI
         
-        return {
-            'type': 'cross_track_error',
-            'xte': xte,
-            'xte_mode': xte_mode,
-            'nav_terminated': nav_terminated
-        }
+        return CrossTrackErrorMsg(xte, xte_mode, nav_terminated)
     
     def parse_navigation_route_info(self, data):
         """Parse PGN 129281 - Navigation Route/WP Information"""
@@ -138,30 +264,22 @@ class NMEA2000Parser:
             return None
         
         # Route/WP ID
-        route_id = struct.unpack('<H', data[0:2])[0]
-        waypoint_id = struct.unpack('<H', data[2:4])[0]
+        route_id = _from_bytes(data[0:2], 'little')
+        waypoint_id = _from_bytes(data[2:4], 'little')
         
         # Distance and bearing to waypoint
-        distance_to_waypoint = struct.unpack('<I', data[4:8])[0] * 0.01  # meters to nm
-        bearing_to_waypoint = struct.unpack('<H', data[8:10])[0] * 0.0001 * 180 / math.pi
+        distance_to_waypoint = _from_bytes(data[4:8], 'little') * _CENTI  # meters to nm
+        bearing_to_waypoint = _from_bytes(data[8:10], 'little') * _ANGLE_SCALE
         
         # Destination waypoint position
-        dest_latitude = struct.unpack('<i', data[10:14])[0] * 1e-7
-        dest_longitude = struct.unpack('<i', data[14:18])[0] * 1e-7 if len(data) >= 18 else None
-        
-        result = {
-            'type': 'navigation_route_info',
-            'route_id': route_id,
-            'waypoint_id': waypoint_id,
-            'distance_to_waypoint': distance_to_waypoint,
-            'bearing_to_waypoint': bearing_to_waypoint,
-            'destination_latitude': dest_latitude
-        }
-        
-        if dest_longitude is not None:
-            result['destination_longitude'] = dest_longitude
+        dest_latitude = _from_bytes(data[10:14], 'little', signed=True) * _LATLON_SCALE
+        dest_longitude = (_from_bytes(data[14:18], 'little', signed=True) *
+                          _LATLON_SCALE if len(data) >= 18 else None)
         
-        return result
+        return NavigationRouteInfoMsg(route_id, waypoint_id,
+                                      distance_to_waypoint,
+                                      bearing_to_waypoint,
+                                      dest_latitude, dest_longitude)
     
     def parse_waypoint_list(self, data):
         """Parse PGN 129540 - GNSS Sats in View"""
@@ -170,11 +288,7 @@ class NMEA2000Parser:
         if len(data) < 8:
             return None
         
-        return {
-            'type': 'waypoint_list',
-            'raw_data': data.hex(),
-            'length': len(data)
-        }
+        return WaypointListMsg(data.hex(), len(data))
     
     def parse_route_waypoint_database(self, data):
         """Parse PGN 130074 - Route and WP Service - Database List"""
@@ -182,42 +296,29 @@ class NMEA2000Parser:
             return None
         
         # Route/Database ID
-        database_id = struct.unpack('<H', data[0:2])[0]
-        route_id = struct.unpack('<H', data[2:4])[0]
+        database_id = _from_bytes(data[0:2], 'little')
+        route_id = _from_bytes(data[2:4], 'little')
         
         # Navigation direction and supplementary route info
         nav_direction = data[4] & 0x07
         supplementary_route = (data[4] & 0x08) != 0
         
-        # Waypoint coordinates if available
-        waypoints = []
-        offset = 8
-        
-        while offset + 16 <= len(data):
-            try:
-                waypoint_id = struct.unpack('<H', data[offset:offset+2])[0]
-                waypoint_lat = struct.unpack('<i', data[offset+2:offset+6])[0] * 1e-7
-                waypoint_lon = struct.unpack('<i', data[offset+6:offset+10])[0] * 1e-7
-                
-                waypoints.append({
-                    'waypoint_id': waypoint_id,
-                    'latitude': waypoint_lat,
-                    'longitude': waypoint_lon,
-                    'name': f"WP{waypoint_id}"
-                })
-                
-                offset += 16  # Move to next waypoint
-            except:
-                break
+        # Waypoint coordinates if available: decode all records in one
+        # C-level pass. Names are omitted here; consumers that store the
+        # waypoints fill in the WP<id> default themselves
+        n = (len(data) - 8) // 16
+        if n > 0:
+            records = np.frombuffer(data, dtype=_WP_RECORD, count=n, offset=8)
+            waypoints = [{'waypoint_id': int(rec['id']),
+                          'latitude': int(rec['lat']) * _LATLON_SCALE,
+                          'longitude': int(rec['lon']) * _LATLON_SCALE}
+                         for rec in records]
+        else:
+            waypoints = []
         
-        return {
-            'type': 'route_waypoint_database',
-            'database_id': database_id,
-            'route_id': route_id,
-            'nav_direction': nav_direction,
-            'supplementary_route': supplementary_route,
-            'waypoints': waypoints
-        }
+        return RouteWaypointDatabaseMsg(database_id, route_id,
+                                        nav_direction, supplementary_route,
+                                        waypoints)
     
     def get_waypoint_coordinates(self, waypoint_id):
         """Helper method to get stored waypoint coordinates"""
@@ -0,0 +1,96 @@
+"""
+Numba-JIT Batch Parser for Fixed-Layout NMEA2000 PGNs
+Decodes whole batches of raw frames without per-message interpreter overhead
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    JIT_ENABLED = True
+except ImportError:
+    JIT_ENABLED = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# Message codes written by parse_batch; frames flagged CODE_FALLBACK
+# (unknown PGN, variable layout, or short frame) must be re-parsed by the
+# Python parser
+CODE_FALLBACK = 0
+CODE_POSITION = 1
+CODE_NAVIGATION = 2
+CODE_WIND = 3
+CODE_WAYPOINT_NAV = 4
+CODE_XTE = 5
+
+# Field-scale constants, matching nmea200_parser
+_ANGLE_SCALE = 0.0001 * 180.0 / math.pi
+_LATLON_SCALE = 1e-7
+_CENTI = 0.01
+
+@njit(cache=True)
+def _u16(buf, offset):
+    """Read a little-endian unsigned 16-bit field"""
+    return np.int64(buf[offset]) | (np.int64(buf[offset + 1]) << 8)
+
+@njit(cache=True)
+def _u32(buf, offset):
+    """Read a little-endian unsigned 32-bit field"""
+    return (np.int64(buf[offset]) | (np.int64(buf[offset + 1]) << 8) |
+            (np.int64(buf[offset + 2]) << 16) |
+            (np.int64(buf[offset + 3]) << 24))
+
+@njit(cache=True)
+def _i32(buf, offset):
+    """Read a little-endian signed 32-bit field"""
+    value = _u32(buf, offset)
+    if value >= 0x80000000:
+        value -= 0x100000000
+    return value
+
+@njit(cache=True)
+def parse_batch(frames, lengths, codes, fields):
+    """Decode fixed-layout PGNs from a (n_frames, max_len) uint8 array
+
+    Writes one message code per frame into codes and up to four numeric
+    fields per frame into fields.
+    """
+    for i in range(frames.shape[0]):
+        codes[i] = CODE_FALLBACK
+        n = lengths[i]
+        if n < 8:
+            continue
+
+        buf = frames[i]
+        can_id = ((np.int64(buf[0]) << 24) | (np.int64(buf[1]) << 16) |
+                  (np.int64(buf[2]) << 8) | np.int64(buf[3]))
+        pgn = (can_id >> 8) & 0x1FFFF
+        d = 8  # payload starts past the header
+
+        if pgn == 129025 and n - d >= 8:
+            fields[i, 0] = _i32(buf, d + 0) * _LATLON_SCALE
+            fields[i, 1] = _i32(buf, d + 4) * _LATLON_SCALE
+            codes[i] = CODE_POSITION
+        elif pgn == 129026 and n - d >= 8:
+            fields[i, 0] = _u16(buf, d + 2) * _ANGLE_SCALE
+            fields[i, 1] = _u16(buf, d + 4) * _CENTI
+            codes[i] = CODE_NAVIGATION
+        elif pgn == 130306 and n - d >= 6:
+            fields[i, 0] = _u16(buf, d + 0) * _CENTI
+            fields[i, 1] = _u16(buf, d + 2) * _ANGLE_SCALE
+            fields[i, 2] = buf[d + 4] & 0x07
+            codes[i] = CODE_WIND
+        elif pgn == 129284 and n - d >= 8:
+            fields[i, 0] = _u16(buf, d + 4) * _ANGLE_SCALE
+            fields[i, 1] = _u32(buf, d + 0) * _CENTI
+            codes[i] = CODE_WAYPOINT_NAV
+        elif pgn == 129283 and n - d >= 6:
+            fields[i, 0] = _i32(buf, d + 1) * _CENTI
+            fields[i, 1] = buf[d] & 0x0F
+            fields[i, 2] = 1.0 if buf[d] & 0x40 else 0.0
+            codes[i] = CODE_XTE
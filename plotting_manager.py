@@ -3,98 +3,165 @@ Plotting Manager for Navigation Data Visualization
 Handles matplotlib plotting of time-series navigation data
 """
 
+import time
+
 import matplotlib.pyplot as plt
-from collections import deque
-from datetime import datetime
+
+import numpy as np
+
+# Plotted data channels, excluding the shared time axis
+PLOT_KEYS = ('sog', 'cog', 'true_wind_speed', 'absolute_wind_direction')
+
+# Refreshes are skipped when no data arrived or the last one was under
+# this long ago, capping plot work at ~15 FPS
+MIN_REDRAW_SECONDS = 1.0 / 15.0
 
 class PlottingManager:
     def __init__(self, max_points=60):
         self.max_points = max_points
-        
-        # Initialize plot data storage
-        self.plot_data = {
-            'time': deque(maxlen=max_points),
-            'sog': deque(maxlen=max_points),
-            'cog': deque(maxlen=max_points),
-            'true_wind_speed': deque(maxlen=max_points),
-            'absolute_wind_direction': deque(maxlen=max_points)
-        }
-        
-        # Create matplotlib figure
-        self.fig, self.axes = plt.subplots(2, 2, figsize=(8, 6))
+
+        # Fixed-size ring buffers per channel plus a shared write position;
+        # slicing these hands matplotlib arrays without per-refresh copies
+        self._buffers = {key: np.zeros(max_points) for key in PLOT_KEYS}
+        self._times = np.zeros(max_points, dtype=np.int64)
+        self._head = 0
+        self._count = 0
+
+        # Refresh throttle: set by add_data_point, cleared on redraw
+        self._data_pending = False
+        self._last_redraw = 0.0
+
+        # Create matplotlib figure; constrained layout adjusts spacing
+        # incrementally instead of re-solving the whole grid per refresh
+        self.fig, self.axes = plt.subplots(2, 2, figsize=(8, 6),
+                                           constrained_layout=True)
         self.fig.suptitle('5-minute Averages')
-        
+
         # Configure plot styling
         plt.style.use('default')
         self.fig.patch.set_facecolor('white')
+
+        # Create the line artists and static styling once; update_plots
+        # only pushes new data into them
+        plot_specs = [
+            ('sog', self.axes[0, 0], 'b-', 'Speed Over Ground (kts)'),
+            ('cog', self.axes[0, 1], 'g-', 'Course Over Ground (°)'),
+            ('true_wind_speed', self.axes[1, 0], 'r-', 'True Wind Speed (kts)'),
+            ('absolute_wind_direction', self.axes[1, 1], 'm-',
+             'Absolute Wind Direction (°)'),
+        ]
+        self.lines = {}
+        for key, ax, style, title in plot_specs:
+            line, = ax.plot([], [], style, linewidth=2)
+            ax.set_title(title, fontsize=10)
+            ax.grid(True, alpha=0.3)
+            ax.tick_params(axis='x', rotation=45, labelsize=8)
+            ax.tick_params(axis='y', labelsize=8)
+            self.lines[key] = line
+        self.axes[1, 1].set_ylim(0, 360)
+
+        # Per-axes backgrounds captured after a full draw; draw() blits
+        # the line artists over them until they are invalidated
+        self._backgrounds = None
     
     def add_data_point(self, averages):
         """Add a new data point to the plots"""
-        now = datetime.now()
-        
-        self.plot_data['time'].append(now)
-        self.plot_data['sog'].append(averages.get('sog', 0))
-        self.plot_data['cog'].append(averages.get('cog', 0))
-        self.plot_data['true_wind_speed'].append(averages.get('true_wind_speed', 0))
-        self.plot_data['absolute_wind_direction'].append(averages.get('absolute_wind_direction', 0))
+        head = self._head
+        # Integer nanoseconds: no datetime object allocation per point
+        self._times[head] = time.time_ns()
+        for key in PLOT_KEYS:
+            self._buffers[key][head] = averages.get(key, 0)
+        self._head = (head + 1) % self.max_points
+        if self._count < self.max_points:
+            self._count += 1
+        self._data_pending = True
     
     def update_plots(self):
-        """Update all plots with current data"""
-        # Clear all axes
+        """Push current data into the line artists
+
+        Returns None when there is nothing to redraw (no new data, or the
+        refresh budget was hit); otherwise True when axes limits changed
+        and the caller needs a full redraw instead of blitting the lines.
+        """
+        if not self._data_pending or self._count < 2:
+            return None
+        now = time.monotonic()
+        if now - self._last_redraw < MIN_REDRAW_SECONDS:
+            return None
+        self._data_pending = False
+        self._last_redraw = now
+
+        # Chronological view of the rings: one index computation shared by
+        # every channel, no list materialization
+        idx = (np.arange(self._count) + self._head - self._count) % self.max_points
+        # One bulk conversion to datetime64 for the shared x axis
+        times = self._times[idx].astype('datetime64[ns]')
+        for key, line in self.lines.items():
+            line.set_data(times, self._buffers[key][idx])
+
+        limits_changed = False
         for ax in self.axes.flat:
-            ax.clear()
-        
-        if len(self.plot_data['time']) > 1:
-            times = list(self.plot_data['time'])
-            
-            # SOG plot
-            self.axes[0,0].plot(times, list(self.plot_data['sog']), 'b-', linewidth=2)
-            self.axes[0,0].set_title('Speed Over Ground (kts)', fontsize=10)
-            self.axes[0,0].grid(True, alpha=0.3)
-            self.axes[0,0].tick_params(axis='x', rotation=45, labelsize=8)
-            self.axes[0,0].tick_params(axis='y', labelsize=8)
-            
-            # COG plot
-            self.axes[0,1].plot(times, list(self.plot_data['cog']), 'g-', linewidth=2)
-            self.axes[0,1].set_title('Course Over Ground (°)', fontsize=10)
-            self.axes[0,1].grid(True, alpha=0.3)
-            self.axes[0,1].tick_params(axis='x', rotation=45, labelsize=8)
-            self.axes[0,1].tick_params(axis='y', labelsize=8)
-            
-            # True Wind Speed
-            self.axes[1,0].plot(times, list(self.plot_data['true_wind_speed']), 'r-', linewidth=2)
-            self.axes[1,0].set_title('True Wind Speed (kts)', fontsize=10)
-            self.axes[1,0].grid(True, alpha=0.3)
-            self.axes[1,0].tick_params(axis='x', rotation=45, labelsize=8)
-            self.axes[1,0].tick_params(axis='y', labelsize=8)
-            
-            # Absolute Wind Direction
-            self.axes[1,1].plot(times, list(self.plot_data['absolute_wind_direction']), 'm-', linewidth=2)
-            self.axes[1,1].set_title('Absolute Wind Direction (°)', fontsize=10)
-            self.axes[1,1].set_ylim(0, 360)
-            self.axes[1,1].grid(True, alpha=0.3)
-            self.axes[1,1].tick_params(axis='x', rotation=45, labelsize=8)
-            self.axes[1,1].tick_params(axis='y', labelsize=8)
-        
-        # Adjust layout to prevent overlapping
-        self.fig.tight_layout()
-    
+            old_limits = (ax.get_xlim(), ax.get_ylim())
+            ax.relim()
+            # The wind-direction axis keeps its fixed 0-360 range
+            ax.autoscale_view(scaley=ax is not self.axes[1, 1])
+            if (ax.get_xlim(), ax.get_ylim()) != old_limits:
+                limits_changed = True
+
+        return limits_changed
+
+    def draw(self, canvas, full=False):
+        """Render the figure onto a canvas, blitting lines when possible
+
+        A full draw re-renders ticks and grids and recaches the per-axes
+        backgrounds; otherwise only the line artists are blitted over the
+        cached backgrounds.
+        """
+        if full or self._backgrounds is None:
+            canvas.draw()
+            self._backgrounds = [canvas.copy_from_bbox(ax.bbox)
+                                 for ax in self.axes.flat]
+            return
+
+        for background, line in zip(self._backgrounds, self.lines.values()):
+            ax = line.axes
+            canvas.restore_region(background)
+            ax.draw_artist(line)
+            canvas.blit(ax.bbox)
+
+    def invalidate_backgrounds(self, *args):
+        """Drop cached backgrounds, forcing a full draw on the next draw()"""
+        self._backgrounds = None
+
     def get_figure(self):
         """Get the matplotlib figure for embedding in UI"""
         return self.fig
     
     def clear_data(self):
         """Clear all plot data"""
-        for key in self.plot_data:
-            self.plot_data[key].clear()
+        self._head = 0
+        self._count = 0
+        self._data_pending = False
+        for line in self.lines.values():
+            line.set_data([], [])
     
     def set_max_points(self, max_points):
         """Change the maximum number of points to display"""
+        # Rebuild the rings, keeping the most recent points in order
+        keep = min(self._count, max_points)
+        idx = (np.arange(keep) + self._head - keep) % self.max_points
+
+        buffers = {key: np.zeros(max_points) for key in PLOT_KEYS}
+        times = np.zeros(max_points, dtype=np.int64)
+        times[:keep] = self._times[idx]
+        for key in PLOT_KEYS:
+            buffers[key][:keep] = self._buffers[key][idx]
+
         self.max_points = max_points
-        for key in self.plot_data:
-            # Create new deque with new maxlen
-            old_data = list(self.plot_data[key])
-            self.plot_data[key] = deque(old_data[-max_points:], maxlen=max_points)
+        self._buffers = buffers
+        self._times = times
+        self._head = keep % max_points
+        self._count = keep
     
     def export_plot(self, filename):
         """Export current plot to file"""
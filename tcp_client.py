@@ -3,18 +3,49 @@ TCP Client Library for NMEA2000 Data Reception
 Handles TCP connection and message reception in a separate thread
 """
 
+import asyncio
+import queue
+import selectors
 import socket
 import threading
+import time
+from binascii import b2a_hex
 from datetime import datetime
 
+# Log lines are batched in memory and written out together once this many
+# lines have accumulated, or once the flush interval has elapsed
+LOG_FLUSH_LINES = 256
+LOG_FLUSH_SECONDS = 1.0
+
+# Frames queued between the receive thread and the callback worker; when
+# the consumer falls this far behind, further frames are dropped and
+# counted rather than stalling the socket
+QUEUE_CAPACITY = 4096
+
 class NMEA2000TCPClient:
-    def __init__(self, message_callback=None, status_callback=None):
+    def __init__(self, message_callback=None, batch_callback=None,
+                 status_callback=None):
         self.socket = None
         self.connected = False
         self.receive_thread = None
+        # Preallocated receive buffer; recv_into fills it in place and
+        # frames are handed out as zero-copy memoryview slices
+        self._rx_buf = bytearray(65536)
+        self._rx_view = memoryview(self._rx_buf)
+        # Write end of the socketpair disconnect() uses to wake the
+        # receive thread out of its selector wait immediately
+        self._shutdown_w = None
+        # Bounded hand-off between the receive thread and the callback
+        # worker, so slow consumers never back up the socket
+        self._q = None
+        self._worker_thread = None
+        self._overflow = 0
         self.message_callback = message_callback
+        self.batch_callback = batch_callback
         self.status_callback = status_callback
         self.log_file = None
+        self._log_buf = []
+        self._last_log_flush = 0.0
         self.message_count = 0
         
     def connect(self, server, port):
@@ -23,13 +54,25 @@ class NMEA2000TCPClient:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(10)  # 10 second timeout
             self.socket.connect((server, port))
+            # Non-blocking from here on; the receive thread sleeps in a
+            # selector instead of spinning on recv timeouts
+            self.socket.setblocking(False)
             self.connected = True
             
-            # Open log file
+            # Open log file with a large buffer; lines are batched in
+            # memory and flushed periodically rather than per message
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.log_file = open(f"nmea2000_log_{timestamp}.txt", "w")
+            self.log_file = open(f"nmea2000_log_{timestamp}.txt", "w",
+                                 buffering=65536)
+            self._log_buf = []
+            self._last_log_flush = time.monotonic()
             
-            # Start receiving thread
+            # Start the callback worker and the receiving thread
+            self._q = queue.Queue(maxsize=QUEUE_CAPACITY)
+            self._worker_thread = threading.Thread(target=self._drain_queue)
+            self._worker_thread.daemon = True
+            self._worker_thread.start()
+
             self.receive_thread = threading.Thread(target=self._receive_data)
             self.receive_thread.daemon = True
             self.receive_thread.start()
@@ -47,16 +90,38 @@ class NMEA2000TCPClient:
     def disconnect(self):
         """Disconnect from TCP server"""
         self.connected = False
-        
+
+        # Wake the receive thread so it exits before the socket goes away
+        if self._shutdown_w:
+            try:
+                self._shutdown_w.send(b'\x00')
+            except:
+                pass
+
+        if self.receive_thread:
+            if self.receive_thread is not threading.current_thread():
+                self.receive_thread.join(timeout=2)
+            self.receive_thread = None
+
+        # Stop the worker after the receive thread so nothing is enqueued
+        # behind the sentinel
+        if self._worker_thread:
+            self._q.put(None)
+            if self._worker_thread is not threading.current_thread():
+                self._worker_thread.join(timeout=2)
+            self._worker_thread = None
+            self._q = None
+
         if self.socket:
             try:
                 self.socket.close()
             except:
                 pass
             self.socket = None
-        
+
         if self.log_file:
             try:
+                self._flush_log()
                 self.log_file.close()
             except:
                 pass
@@ -67,50 +132,150 @@ class NMEA2000TCPClient:
     
     def _receive_data(self):
         """Receive data in background thread"""
-        buffer = b''
-        
+        rx_buf = self._rx_buf
+        rx_view = self._rx_view
+        head = 0
+        tail = 0
+
+        # The thread sleeps here until data arrives or disconnect() writes
+        # a byte to the shutdown socketpair; no timeout polling
+        shutdown_r, self._shutdown_w = socket.socketpair()
+        selector = selectors.DefaultSelector()
+        selector.register(self.socket, selectors.EVENT_READ, 'data')
+        selector.register(shutdown_r, selectors.EVENT_READ, 'shutdown')
+
+        # Hoist the per-iteration attribute lookups into locals;
+        # self.connected stays a live attribute read so disconnect() is
+        # seen immediately
+        select = selector.select
+        recv_into = self.socket.recv_into
+        find = rx_buf.find
+        log_message = self._log_message
+        put_frame = self._q.put_nowait
+
         while self.connected:
             try:
-                data = self.socket.recv(1024)
-                if not data:
+                if any(key.data == 'shutdown' for key, _ in select()):
+                    break
+
+                n = recv_into(rx_view[tail:])
+                if not n:
                     break
-                
-                buffer += data
-                
-                # Process complete messages (assuming messages are terminated by newline)
-                while b'\n' in buffer:
-                    line, buffer = buffer.split(b'\n', 1)
-                    if line:
-                        self._process_message(line)
-                        
-            except socket.timeout:
+
+                tail += n
+
+                # Collect the complete messages from this recv (messages are
+                # terminated by newline) and deliver them as one batch of
+                # memoryview slices; callbacks run synchronously, so the
+                # slices stay valid until the buffer is compacted below
+                while True:
+                    nl = find(b'\n', head, tail)
+                    if nl < 0:
+                        break
+                    if nl > head:
+                        line = rx_view[head:nl]
+                        log_message(line)
+                        # Copied to bytes because the frame is consumed on
+                        # another thread after this buffer moves on
+                        try:
+                            put_frame(bytes(line))
+                        except queue.Full:
+                            self._overflow += 1
+                    head = nl + 1
+
+                # Reclaim buffer space now that the batch is consumed
+                if head == tail:
+                    head = 0
+                    tail = 0
+                elif tail == len(rx_buf):
+                    if head == 0:
+                        # A frame longer than the whole buffer has no
+                        # terminator; it cannot be valid, so drop it
+                        tail = 0
+                    else:
+                        remainder = tail - head
+                        rx_buf[:remainder] = rx_buf[head:tail]
+                        head = 0
+                        tail = remainder
+
+            except BlockingIOError:
                 continue
             except Exception as e:
                 if self.connected:
                     if self.status_callback:
                         self.status_callback(f'Receive error: {str(e)}')
                 break
-        
+
+        selector.close()
+        self._shutdown_w.close()
+        self._shutdown_w = None
+        shutdown_r.close()
+
         self.connected = False
         if self.status_callback:
             self.status_callback('Connection lost')
     
-    def _process_message(self, raw_data):
-        """Process received message"""
-        # Log the raw message
-        timestamp = datetime.now().isoformat()
+    def _drain_queue(self):
+        """Deliver queued frames to the callbacks (worker thread)"""
+        q = self._q
+
+        while True:
+            raw = q.get()
+            if raw is None:
+                break
+
+            # Drain whatever else is already waiting into one batch
+            batch = [raw]
+            done = False
+            while True:
+                try:
+                    raw = q.get_nowait()
+                except queue.Empty:
+                    break
+                if raw is None:
+                    done = True
+                    break
+                batch.append(raw)
+
+            if self.batch_callback:
+                self.batch_callback(batch)
+            elif self.message_callback:
+                for raw in batch:
+                    self.message_callback(raw)
+
+            if done:
+                break
+
+    def get_overflow_count(self):
+        """Get the number of frames dropped because the queue was full"""
+        return self._overflow
+
+    def _log_message(self, raw_data):
+        """Log a received message and count it"""
         if self.log_file:
+            # Integer wall-clock nanoseconds: no datetime allocation or
+            # isoformat call per frame; convert offline when reading logs.
+            # b2a_hex is the C fast path for the hex dump
+            self._log_buf.append(
+                f"{time.time_ns()}: {b2a_hex(raw_data).decode('ascii')}\n")
+            # Write the batch out once it is large enough or old enough;
+            # one write call replaces hundreds of per-message syscalls
+            if (len(self._log_buf) >= LOG_FLUSH_LINES or
+                    time.monotonic() - self._last_log_flush > LOG_FLUSH_SECONDS):
+                self._flush_log()
+
+        self.message_count += 1
+
+    def _flush_log(self):
+        """Write any batched log lines to disk"""
+        if self._log_buf and self.log_file:
             try:
-                self.log_file.write(f"{timestamp}: {raw_data.hex()}\n")
+                self.log_file.write(''.join(self._log_buf))
                 self.log_file.flush()
             except:
                 pass
-        
-        self.message_count += 1
-        
-        # Call message callback if provided
-        if self.message_callback:
-            self.message_callback(raw_data)
+            self._log_buf.clear()
+        self._last_log_flush = time.monotonic()
     
     def is_connected(self):
         """Check if client is connected"""
@@ -122,4 +287,120 @@ class NMEA2000TCPClient:
     
     def reset_message_count(self):
         """Reset message counter"""
-        self.message_count = 0
\ No newline at end of file
+        self.message_count = 0
+class NMEA2000AsyncTCPClient(NMEA2000TCPClient):
+    """asyncio variant of the TCP client
+
+    Runs an event loop in a dedicated daemon thread and frames messages
+    with StreamReader.readuntil, so several feeds could share one loop
+    without a thread per connection. The synchronous connect/disconnect
+    API and the callbacks match the threaded client.
+    """
+
+    def __init__(self, message_callback=None, batch_callback=None,
+                 status_callback=None):
+        super().__init__(message_callback, batch_callback, status_callback)
+        self._loop = None
+        self._loop_thread = None
+        self._reader = None
+        self._writer = None
+
+    def connect(self, server, port):
+        """Connect to TCP server"""
+        try:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._loop.run_forever)
+            self._loop_thread.daemon = True
+            self._loop_thread.start()
+
+            # Open the connection on the loop and wait for it here
+            future = asyncio.run_coroutine_threadsafe(
+                self._open(server, port), self._loop)
+            future.result(timeout=10)
+            self.connected = True
+
+            # Open log file, same batched writer as the threaded client
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.log_file = open(f"nmea2000_log_{timestamp}.txt", "w",
+                                 buffering=65536)
+            self._log_buf = []
+            self._last_log_flush = time.monotonic()
+
+            asyncio.run_coroutine_threadsafe(self._receive(), self._loop)
+
+            if self.status_callback:
+                self.status_callback(f'Connected to {server}:{port}')
+
+            return True
+
+        except Exception as e:
+            self._stop_loop()
+            if self.status_callback:
+                self.status_callback(f'Connection failed: {str(e)}')
+            return False
+
+    def disconnect(self):
+        """Disconnect from TCP server"""
+        self.connected = False
+        self._stop_loop()
+
+        if self.log_file:
+            try:
+                self._flush_log()
+                self.log_file.close()
+            except:
+                pass
+            self.log_file = None
+
+        if self.status_callback:
+            self.status_callback('Disconnected')
+
+    async def _open(self, server, port):
+        """Establish the stream connection (runs on the loop)"""
+        self._reader, self._writer = await asyncio.open_connection(server, port)
+
+    async def _receive(self):
+        """Receive messages until the connection drops (runs on the loop)"""
+        reader = self._reader
+
+        while self.connected:
+            try:
+                line = await reader.readuntil(b'\n')
+            except asyncio.IncompleteReadError:
+                break
+            except Exception as e:
+                if self.connected:
+                    if self.status_callback:
+                        self.status_callback(f'Receive error: {str(e)}')
+                break
+
+            line = line[:-1]
+            if line:
+                self._log_message(line)
+                if self.batch_callback:
+                    self.batch_callback([line])
+                elif self.message_callback:
+                    self.message_callback(line)
+
+        if self.connected:
+            self.connected = False
+            if self.status_callback:
+                self.status_callback('Connection lost')
+
+    def _stop_loop(self):
+        """Tear down the stream and stop the loop thread"""
+        loop = self._loop
+        if loop is None:
+            return
+        self._loop = None
+
+        if self._writer is not None:
+            writer = self._writer
+            self._writer = None
+            self._reader = None
+            loop.call_soon_threadsafe(writer.close)
+
+        loop.call_soon_threadsafe(loop.stop)
+        if self._loop_thread is not None:
+            self._loop_thread.join(timeout=2)
+            self._loop_thread = None